@@ -3,67 +3,188 @@ Santa API - Backend service for managing Tavus-powered Santa video calls
 Handles: Call initialization, personalization, conversation arcs, analytics
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, validator
-from typing import Optional, Dict, List
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from typing import Literal, Optional, Dict, List
+import asyncio
 import httpx
+import mmap
 import os
+import string
+import threading
+import time
 import yaml
 import random
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import json
+from types import MappingProxyType
+import orjson
+
+# Environment variables
+TAVUS_API_KEY = os.getenv("TAVUS_API_KEY")
+TAVUS_PERSONA_ID = os.getenv("TAVUS_PERSONA_ID")
+TAVUS_BASE_URL = "https://tavusapi.com/v2"
+
+# Debug: Print environment variable status on startup (opt-in via DEBUG=1)
+if os.getenv("DEBUG"):
+    print("=" * 60)
+    print("ENVIRONMENT VARIABLE DEBUG:")
+    print(f"TAVUS_API_KEY present: {bool(TAVUS_API_KEY)}")
+    print(f"TAVUS_API_KEY length: {len(TAVUS_API_KEY) if TAVUS_API_KEY else 0}")
+    print(f"TAVUS_PERSONA_ID present: {bool(TAVUS_PERSONA_ID)}")
+    print(f"TAVUS_PERSONA_ID length: {len(TAVUS_PERSONA_ID) if TAVUS_PERSONA_ID else 0}")
+    print("=" * 60)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared Tavus HTTP client for the app's lifetime
+
+    A single AsyncClient keeps the TCP+TLS connection to Tavus warm and
+    pooled across requests instead of paying a fresh handshake per call.
+    """
+    app.state.http = httpx.AsyncClient(
+        base_url=TAVUS_BASE_URL,
+        headers={"x-api-key": TAVUS_API_KEY or ""},
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+    yield
+    await app.state.http.aclose()
 
 app = FastAPI(
     title="Santa API",
     description="Backend service for personalized Santa video calls",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS - Allow frontend to call this API
+# CORS - Allow frontend to call this API. With an explicit origin the
+# middleware takes its fast equality path; the "*" fallback (local dev)
+# can't be combined with credentials, which this API doesn't need anyway.
+FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN", "*")
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Update with your frontend domain in production
-    allow_credentials=True,
+    allow_origins=[FRONTEND_ORIGIN],
+    allow_credentials=FRONTEND_ORIGIN != "*",
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Environment variables
-TAVUS_API_KEY = os.getenv("TAVUS_API_KEY")
-TAVUS_PERSONA_ID = os.getenv("TAVUS_PERSONA_ID")
-TAVUS_BASE_URL = "https://tavusapi.com/v2"
+# Load conversation arcs from YAML (once, at startup)
+# CSafeLoader is the libyaml C loader - ~10x faster than the pure-Python
+# SafeLoader, which matters for cold starts. Fall back if libyaml is missing.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+CONVERSATION_ARCS_PATH = "conversation-arcs.yaml"
+_ARCS_CACHE_PATH = CONVERSATION_ARCS_PATH + ".json"
+
+
+def _load_conversation_arcs() -> Dict:
+    """Load conversation arcs, using a pre-parsed JSON sidecar when valid.
+
+    JSON parsing is an order of magnitude faster than YAML, so we cache the
+    parsed config as conversation-arcs.yaml.json and only re-parse the YAML
+    when its mtime/size no longer match the values recorded in the sidecar.
+
+    The sidecar is read through mmap: with multiple uvicorn/gunicorn
+    workers, each re-imports this module, but the mapped file lives in the
+    OS page cache so N workers share one copy of the bytes.
+    """
+    stat = os.stat(CONVERSATION_ARCS_PATH)
 
-# Debug: Print environment variable status on startup
-print("=" * 60)
-print("ENVIRONMENT VARIABLE DEBUG:")
-print(f"TAVUS_API_KEY present: {bool(TAVUS_API_KEY)}")
-print(f"TAVUS_API_KEY length: {len(TAVUS_API_KEY) if TAVUS_API_KEY else 0}")
-print(f"TAVUS_PERSONA_ID present: {bool(TAVUS_PERSONA_ID)}")
-print(f"TAVUS_PERSONA_ID length: {len(TAVUS_PERSONA_ID) if TAVUS_PERSONA_ID else 0}")
-print("=" * 60)
+    # Try the sidecar first
+    try:
+        with open(_ARCS_CACHE_PATH, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                cached = orjson.loads(mm[:])
+        if cached.get("_mtime") == stat.st_mtime and cached.get("_size") == stat.st_size:
+            return cached["data"]
+    except (OSError, ValueError, KeyError):
+        pass
 
-# Load conversation arcs from YAML
-with open("conversation-arcs.yaml", "r") as f:
-    CONVERSATION_ARCS = yaml.safe_load(f)
+    # Sidecar missing or stale - parse the YAML and rewrite the cache
+    with open(CONVERSATION_ARCS_PATH, "r") as f:
+        arcs = yaml.load(f, Loader=_YamlLoader)
 
-# In-memory analytics storage (replace with database in production)
-analytics_store = []
+    payload = {"_mtime": stat.st_mtime, "_size": stat.st_size, "data": arcs}
+    encoded = orjson.dumps(payload)
+    try:
+        # Atomic write so a concurrent worker never sees a partial file
+        tmp_path = _ARCS_CACHE_PATH + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_path, _ARCS_CACHE_PATH)
+    except OSError:
+        pass  # read-only filesystem - just skip caching
+
+    return arcs
+
+
+CONVERSATION_ARCS = _load_conversation_arcs()
+
+# In-memory analytics storage (replace with database in production).
+# Events are slotted dataclasses rather than dicts: ~5 string keys per
+# event repeated across the whole buffer add up, and slots cut the
+# per-event footprint several-fold while making field access faster.
+@dataclass(slots=True)
+class StartedEvent:
+    timestamp: float
+    conversation_id: str
+    child_age: int
+    call_duration: str
+    parent_email: Optional[str]
+
+@dataclass(slots=True)
+class CompletedEvent:
+    timestamp: float
+    conversation_id: str
+    actual_duration_seconds: int
+    parent_rating: Optional[int]
+    parent_feedback: Optional[str]
+    child_enjoyed: Optional[bool]
+
+# Bounded ring buffers: only the most recent events are kept for forensics,
+# so memory stays capped on a long-lived process. All-time aggregates live
+# in _Stats below and are unaffected by eviction.
+started_events = deque(maxlen=100_000)
+completed_events = deque(maxlen=100_000)
+
+@dataclass
+class _Stats:
+    """Running aggregates, updated at ingest so /analytics reads are O(1)"""
+    total_started: int = 0
+    started_by_day: Counter = field(default_factory=Counter)
+    duration_counts: Counter = field(default_factory=Counter)
+    age_counts: Counter = field(default_factory=Counter)
+    completed_count: int = 0
+    duration_sum: int = 0
+    rating_sum: int = 0
+    rating_count: int = 0
+
+_stats = _Stats()
+# Background tasks may run concurrently in the threadpool
+_stats_lock = threading.Lock()
 
 # ==================== Request/Response Models ====================
 
 class StartCallRequest(BaseModel):
     child_name: str = Field(..., min_length=1, max_length=50, description="Child's first name")
     child_age: int = Field(..., ge=2, le=12, description="Child's age (2-12)")
-    call_duration: str = Field(..., description="Call duration: '5min' or '10min'")
+    # Literal membership is checked in pydantic's compiled core - no
+    # Python-level validator call per request
+    call_duration: Literal['5min', '10min'] = Field(..., description="Call duration: '5min' or '10min'")
     parent_email: Optional[str] = Field(None, description="Parent's email for analytics")
 
-    @validator('call_duration')
-    def validate_duration(cls, v):
-        if v not in ['5min', '10min']:
-            raise ValueError("call_duration must be '5min' or '10min'")
-        return v
-
 class StartCallResponse(BaseModel):
     conversation_id: str
     conversation_url: str
@@ -88,54 +209,82 @@ class AnalyticsResponse(BaseModel):
 
 # ==================== Helper Functions ====================
 
-def load_conversation_arc(duration: str, age: int) -> Dict:
-    """Load conversation arc from YAML config"""
-    arc_data = CONVERSATION_ARCS['arcs'][duration].copy()
+_BUCKET_KEYS = ('ages_2_4', 'ages_5_8', 'ages_9_12')
 
-    # Add age-specific adaptations
-    if age <= 4:
-        arc_data['age_adaptation'] = CONVERSATION_ARCS['age_adaptations']['ages_2_4']
-    elif age <= 8:
-        arc_data['age_adaptation'] = CONVERSATION_ARCS['age_adaptations']['ages_5_8']
-    else:
-        arc_data['age_adaptation'] = CONVERSATION_ARCS['age_adaptations']['ages_9_12']
-
-    # Add timing guidelines
+def _age_bucket(age: int) -> str:
+    """Map a child's age to its adaptation bucket key"""
+    # Branchless: each comparison contributes 0 or 1 to the index
+    return _BUCKET_KEYS[(age > 4) + (age > 8)]
+
+def _build_arc(duration: str, age_bucket: str) -> MappingProxyType:
+    """Merge arc, age adaptation and timing for one combination"""
+    arc_data = dict(CONVERSATION_ARCS['arcs'][duration])
+    arc_data['age_adaptation'] = CONVERSATION_ARCS['age_adaptations'][age_bucket]
     arc_data['timing'] = CONVERSATION_ARCS['timing_guidelines'][duration]
+    return MappingProxyType(arc_data)
+
+# Fully-merged arcs, built once at startup. The config is immutable after
+# load, so callers share read-only views instead of copying per request.
+_ARC_CACHE = {
+    (duration, bucket): _build_arc(duration, bucket)
+    for duration in CONVERSATION_ARCS['arcs']
+    for bucket in _BUCKET_KEYS
+}
 
-    return arc_data
+def load_conversation_arc(duration: str, age: int) -> Dict:
+    """Load conversation arc from YAML config"""
+    return _ARC_CACHE[(duration, _age_bucket(age))]
+
+# Pre-serialized /arcs/{duration} bodies - the payload is immutable for the
+# life of the process, so serialize each one exactly once.
+_ARC_RESPONSES = {
+    duration: orjson.dumps({
+        "duration": duration,
+        "arc": CONVERSATION_ARCS['arcs'][duration],
+        "timing_guidelines": CONVERSATION_ARCS['timing_guidelines'][duration]
+    })
+    for duration in CONVERSATION_ARCS['arcs']
+}
+
+# Greeting templates materialized per age bucket at startup, and a private
+# Random instance so concurrent requests don't contend on the random
+# module's shared global state.
+_GREETINGS = {
+    bucket: list(CONVERSATION_ARCS['greeting_templates'][bucket])
+    for bucket in _BUCKET_KEYS
+}
+_rng = random.Random()
 
 def generate_greeting(child_name: str, child_age: int) -> str:
     """Generate personalized greeting based on age"""
-    if child_age <= 4:
-        templates = CONVERSATION_ARCS['greeting_templates']['ages_2_4']
-    elif child_age <= 8:
-        templates = CONVERSATION_ARCS['greeting_templates']['ages_5_8']
-    else:
-        templates = CONVERSATION_ARCS['greeting_templates']['ages_9_12']
-
-    # Pick random template and format with child's name
-    template = random.choice(templates)
+    templates = _GREETINGS[_age_bucket(child_age)]
+    template = templates[_rng.randrange(len(templates))]
 
-    # Determine gender-neutral term
-    child_term = "child"
+    # "child" is the gender-neutral term used by the templates
+    return template.format(child_name=child_name, child="child")
 
-    return template.format(child_name=child_name, child=child_term)
+def _build_prompt_skeleton(duration: str, age_bucket: str) -> string.Template:
+    """Render the system prompt for one (duration, age bucket) combination.
 
-def create_system_prompt(child_name: str, child_age: int, duration: str, greeting: str, arc: Dict) -> str:
-    """Create enhanced system prompt with conversation context"""
+    Everything except the child's name, age, and greeting is fixed per
+    combination, so we render it once at startup into a string.Template
+    with $child_name/$child_age/$greeting placeholders. The per-request
+    path is then a single substitute() instead of re-iterating all the
+    phases and goals.
+    """
+    arc = _ARC_CACHE[(duration, age_bucket)]
 
     prompt = f"""
 PERSONALIZED CONVERSATION CONTEXT:
 
 Child Information:
-- Name: {child_name}
-- Age: {child_age} years old
+- Name: $child_name
+- Age: $child_age years old
 - Call Duration: {duration} ({arc['total_duration_seconds']} seconds)
 - Language Level: {arc['age_adaptation']['language_level']}
 
 MANDATORY GREETING:
-Start the conversation with: "{greeting}"
+Start the conversation with: "$greeting"
 
 CONVERSATION STRUCTURE:
 You must follow this {duration} arc with {len(arc['phases'])} phases:
@@ -144,25 +293,27 @@ You must follow this {duration} arc with {len(arc['phases'])} phases:
 
     # Add each phase details
     for i, phase in enumerate(arc['phases'], 1):
+        goals = "\n".join(f'  - {goal}' for goal in phase['goals'])
+        guidelines = "\n".join(f'  - {guideline}' for guideline in phase['santa_guidelines'])
         prompt += f"""
 Phase {i}: {phase['name'].replace('_', ' ').title()} ({phase['duration_seconds']}s - {phase['percentage']}%)
 Goals:
-{chr(10).join([f'  - {goal}' for goal in phase['goals']])}
+{goals}
 
 Guidelines:
-{chr(10).join([f'  - {guideline}' for guideline in phase['santa_guidelines']])}
+{guidelines}
 """
 
         # Add suggested questions if available
         if 'suggested_questions' in phase:
-            prompt += f"\nSuggested Questions:\n"
-            prompt += chr(10).join([f'  - {q}' for q in phase['suggested_questions']])
+            prompt += "\nSuggested Questions:\n"
+            prompt += "\n".join(f'  - {q}' for q in phase['suggested_questions'])
             prompt += "\n"
 
     # Add age-specific adaptations
     prompt += f"""
 
-AGE-SPECIFIC ADAPTATIONS (Age {child_age}):
+AGE-SPECIFIC ADAPTATIONS (Age $child_age):
 - Response Length: {arc['age_adaptation']['response_length']}
 - Sentence Complexity: {arc['age_adaptation']['sentence_complexity']}
 - Energy Level: {arc['age_adaptation']['energy']}
@@ -174,7 +325,7 @@ TIMING GUIDELINES:
 - Pause between responses: {arc['timing']['pause_between_responses_seconds']} seconds
 
 CONVERSATION RULES:
-1. Use {child_name}'s name naturally 2-3 times per minute
+1. Use $child_name's name naturally 2-3 times per minute
 2. Keep responses within time limits for your age group
 3. Listen actively - reference what the child says
 4. Never promise specific gifts - use "I'll see what I can do" or "I'll talk to my elves"
@@ -192,29 +343,61 @@ QUALITY INDICATORS:
 - Name usage feels natural, not forced
 - Transitions between phases are smooth
 
-Remember: You are Santa Claus. Be magical, kind, and create a memorable experience for {child_name}!
+Remember: You are Santa Claus. Be magical, kind, and create a memorable experience for $child_name!
 """
 
-    return prompt
+    return string.Template(prompt)
+
+# Precomputed per-(duration, age bucket) caches - only 2 durations x 3 age
+# buckets exist, so the per-request work collapses to a dict lookup.
+_PROMPT_SKELETONS = {
+    (duration, bucket): _build_prompt_skeleton(duration, bucket)
+    for duration in CONVERSATION_ARCS['arcs']
+    for bucket in _BUCKET_KEYS
+}
+
+def create_system_prompt(child_name: str, child_age: int, duration: str, greeting: str) -> str:
+    """Create enhanced system prompt with conversation context"""
+    skeleton = _PROMPT_SKELETONS[(duration, _age_bucket(child_age))]
+    return skeleton.safe_substitute(
+        child_name=child_name,
+        child_age=child_age,
+        greeting=greeting
+    )
 
 def track_call_started(call_data: Dict):
     """Track call initiation for analytics"""
-    analytics_store.append({
-        'event': 'call_started',
-        'timestamp': datetime.utcnow().isoformat(),
-        'conversation_id': call_data['conversation_id'],
-        'child_age': call_data['child_age'],
-        'call_duration': call_data['call_duration'],
-        'parent_email': call_data.get('parent_email')
-    })
+    # Epoch floats: cheap to store and compare, no ISO parsing on read.
+    # Format to ISO lazily at the response boundary if ever needed.
+    started_events.append(StartedEvent(
+        timestamp=time.time(),
+        conversation_id=call_data['conversation_id'],
+        child_age=call_data['child_age'],
+        call_duration=call_data['call_duration'],
+        parent_email=call_data.get('parent_email')
+    ))
+    with _stats_lock:
+        _stats.total_started += 1
+        _stats.started_by_day[datetime.utcnow().date()] += 1
+        _stats.duration_counts[call_data['call_duration']] += 1
+        _stats.age_counts[str(call_data['child_age'])] += 1
 
 def track_call_completed(completion_data: Dict):
     """Track call completion for analytics"""
-    analytics_store.append({
-        'event': 'call_completed',
-        'timestamp': datetime.utcnow().isoformat(),
-        **completion_data
-    })
+    completed_events.append(CompletedEvent(
+        timestamp=time.time(),
+        conversation_id=completion_data['conversation_id'],
+        actual_duration_seconds=completion_data['actual_duration_seconds'],
+        parent_rating=completion_data.get('parent_rating'),
+        parent_feedback=completion_data.get('parent_feedback'),
+        child_enjoyed=completion_data.get('child_enjoyed')
+    ))
+    with _stats_lock:
+        _stats.completed_count += 1
+        _stats.duration_sum += completion_data['actual_duration_seconds']
+        if completion_data.get('parent_rating'):
+            _stats.rating_sum += completion_data['parent_rating']
+            _stats.rating_count += 1
 
 # ==================== API Endpoints ====================
 
@@ -247,13 +430,8 @@ async def health_check():
     # Check if Tavus API is reachable (simple ping)
     tavus_reachable = False
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TAVUS_BASE_URL}/personas",
-                headers={"x-api-key": TAVUS_API_KEY},
-                timeout=5.0
-            )
-            tavus_reachable = response.status_code in [200, 401]  # 401 means API is up, auth issue
+        response = await app.state.http.get("/personas", timeout=5.0)
+        tavus_reachable = response.status_code in [200, 401]  # 401 means API is up, auth issue
     except:
         pass
 
@@ -264,10 +442,13 @@ async def health_check():
         "timestamp": datetime.utcnow().isoformat(),
         "configuration": config_status,
         "tavus_api_reachable": tavus_reachable,
-        "total_calls_tracked": len([x for x in analytics_store if x['event'] == 'call_started'])
+        "total_calls_tracked": _stats.total_started
     }
 
-@app.post("/api/santa/start-call", response_model=StartCallResponse)
+# response_model is skipped on purpose: the body is assembled from
+# known-shape data, so re-validating it through pydantic per request is
+# pure overhead. The model is kept for the OpenAPI docs only.
+@app.post("/api/santa/start-call", responses={200: {"model": StartCallResponse}})
 async def start_santa_call(
     request: StartCallRequest,
     background_tasks: BackgroundTasks
@@ -299,8 +480,7 @@ async def start_santa_call(
         request.child_name,
         request.child_age,
         request.call_duration,
-        greeting,
-        conversation_arc
+        greeting
     )
 
     # Prepare Tavus API request
@@ -323,26 +503,42 @@ async def start_santa_call(
         }
     }
 
-    # Call Tavus API
+    # Encode the body with orjson up front - the conversational context is
+    # several KB of prompt text, which stdlib json escapes much more slowly.
+    tavus_body = orjson.dumps(tavus_request)
+
+    # Fire the Tavus call (shared pooled client, see lifespan), then do the
+    # local response prep while it's in flight - wall time becomes
+    # max(tavus, prep) instead of their sum.
+    tavus_task = asyncio.create_task(
+        app.state.http.post(
+            "/conversations",
+            content=tavus_body,
+            headers={"Content-Type": "application/json"}
+        )
+    )
+
+    # Calculate estimated end time and metadata while Tavus responds
+    estimated_end = datetime.utcnow() + timedelta(seconds=max_duration)
+    call_metadata = {
+        "child_name": request.child_name,
+        "child_age": request.child_age,
+        "call_duration": request.call_duration,
+        "greeting": greeting,
+        "arc_name": conversation_arc['name'],
+        "phases": len(conversation_arc['phases'])
+    }
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{TAVUS_BASE_URL}/conversations",
-                headers={
-                    "x-api-key": TAVUS_API_KEY,
-                    "Content-Type": "application/json"
-                },
-                json=tavus_request,
-                timeout=30.0
-            )
+        response = await tavus_task
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Tavus API error: {response.text}"
-                )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Tavus API error: {response.text}"
+            )
 
-            tavus_data = response.json()
+        tavus_data = orjson.loads(response.content)
 
     except httpx.TimeoutException:
         raise HTTPException(
@@ -355,24 +551,14 @@ async def start_santa_call(
             detail=f"Error connecting to Tavus API: {str(e)}"
         )
 
-    # Calculate estimated end time
-    estimated_end = datetime.utcnow() + timedelta(seconds=max_duration)
-
     # Prepare response
-    response_data = StartCallResponse(
-        conversation_id=tavus_data["conversation_id"],
-        conversation_url=tavus_data["conversation_url"],
-        expires_at=tavus_data.get("expires_at", estimated_end.isoformat()),
-        call_metadata={
-            "child_name": request.child_name,
-            "child_age": request.child_age,
-            "call_duration": request.call_duration,
-            "greeting": greeting,
-            "arc_name": conversation_arc['name'],
-            "phases": len(conversation_arc['phases'])
-        },
-        estimated_end_time=estimated_end.isoformat()
-    )
+    response_data = ORJSONResponse({
+        "conversation_id": tavus_data["conversation_id"],
+        "conversation_url": tavus_data["conversation_url"],
+        "expires_at": tavus_data.get("expires_at", estimated_end.isoformat()),
+        "call_metadata": call_metadata,
+        "estimated_end_time": estimated_end.isoformat()
+    })
 
     # Track analytics in background
     background_tasks.add_task(
@@ -420,7 +606,7 @@ async def complete_call(
         "conversation_id": request.conversation_id
     }
 
-@app.get("/api/santa/analytics", response_model=AnalyticsResponse)
+@app.get("/api/santa/analytics", responses={200: {"model": AnalyticsResponse}})
 async def get_analytics():
     """
     Get aggregated analytics for all Santa calls
@@ -434,60 +620,20 @@ async def get_analytics():
     - Breakdown by age group
     """
 
-    if not analytics_store:
-        return AnalyticsResponse(
-            total_calls=0,
-            calls_today=0,
-            average_duration_seconds=0.0,
-            average_rating=0.0,
-            calls_by_duration={},
-            calls_by_age={}
-        )
-
-    # Filter events
-    started_calls = [x for x in analytics_store if x['event'] == 'call_started']
-    completed_calls = [x for x in analytics_store if x['event'] == 'call_completed']
-
-    # Total calls
-    total_calls = len(started_calls)
-
-    # Calls today
-    today = datetime.utcnow().date()
-    calls_today = len([
-        x for x in started_calls
-        if datetime.fromisoformat(x['timestamp']).date() == today
-    ])
-
-    # Average duration
-    if completed_calls:
-        avg_duration = sum(x['actual_duration_seconds'] for x in completed_calls) / len(completed_calls)
-    else:
-        avg_duration = 0.0
-
-    # Average rating
-    ratings = [x['parent_rating'] for x in completed_calls if x.get('parent_rating')]
-    avg_rating = sum(ratings) / len(ratings) if ratings else 0.0
-
-    # Calls by duration
-    calls_by_duration = {}
-    for call in started_calls:
-        duration = call['call_duration']
-        calls_by_duration[duration] = calls_by_duration.get(duration, 0) + 1
-
-    # Calls by age
-    calls_by_age = {}
-    for call in started_calls:
-        age = str(call['child_age'])
-        calls_by_age[age] = calls_by_age.get(age, 0) + 1
-
-    return AnalyticsResponse(
-        total_calls=total_calls,
-        calls_today=calls_today,
-        average_duration_seconds=round(avg_duration, 1),
-        average_rating=round(avg_rating, 2),
-        calls_by_duration=calls_by_duration,
-        calls_by_age=calls_by_age
-    )
+    # All aggregates are maintained at ingest time (see track_call_*),
+    # so this is plain arithmetic regardless of event count.
+    with _stats_lock:
+        avg_duration = _stats.duration_sum / _stats.completed_count if _stats.completed_count else 0.0
+        avg_rating = _stats.rating_sum / _stats.rating_count if _stats.rating_count else 0.0
+
+        return ORJSONResponse({
+            "total_calls": _stats.total_started,
+            "calls_today": _stats.started_by_day[datetime.utcnow().date()],
+            "average_duration_seconds": round(avg_duration, 1),
+            "average_rating": round(avg_rating, 2),
+            "calls_by_duration": dict(_stats.duration_counts),
+            "calls_by_age": dict(_stats.age_counts)
+        })
 
 @app.get("/api/santa/arcs/{duration}")
 async def get_conversation_arc(duration: str):
@@ -496,18 +642,12 @@ async def get_conversation_arc(duration: str):
 
     Useful for debugging or showing parents what to expect
     """
-    if duration not in ['5min', '10min']:
+    body = _ARC_RESPONSES.get(duration)
+    if body is None:
         raise HTTPException(400, "Duration must be '5min' or '10min'")
 
-    arc = CONVERSATION_ARCS['arcs'].get(duration)
-    if not arc:
-        raise HTTPException(404, "Arc not found")
-
-    return {
-        "duration": duration,
-        "arc": arc,
-        "timing_guidelines": CONVERSATION_ARCS['timing_guidelines'][duration]
-    }
+    # Serve the bytes serialized at startup - no per-request encoding
+    return Response(content=body, media_type="application/json")
 
 # ==================== Error Handlers ====================
 